@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Self
+from datetime import timedelta
+from functools import cache
+from typing import Annotated, Any, Self
 
 from pydantic import Field, HttpUrl, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -10,7 +12,7 @@ from safir.logging import LogLevel, Profile
 
 from .models.data_collections import ButlerDataCollection
 
-__all__ = ["Config", "config"]
+__all__ = ["Config", "config", "get_config"]  # noqa: F822
 
 
 class Config(BaseSettings):
@@ -46,9 +48,38 @@ class Config(BaseSettings):
     ] = None
     """Slack webhook for exception reporting."""
 
+    availability_cache_ttl: Annotated[
+        timedelta,
+        Field(title="How long VOSI availability results are reused"),
+    ] = timedelta(seconds=30)
+    """How long VOSI availability results are reused before rechecking."""
+
+    thread_pool_size: Annotated[
+        int,
+        Field(
+            title="Number of worker threads for blocking Butler queries", ge=1
+        ),
+    ] = 40
+    """Number of worker threads for blocking Butler queries."""
+
+    max_form_body_size: Annotated[
+        int, Field(title="Maximum size in bytes of a POST form body", ge=1)
+    ] = 65536
+    """Maximum size in bytes of a POST form body."""
+
+    query_coalescing: Annotated[
+        bool, Field(title="Share results between identical concurrent queries")
+    ] = False
+    """Whether identical queries running concurrently share one execution."""
+
     @model_validator(mode="after")
     def _validate_butler_data_collections(self) -> Self:
         """Validate the Butler data collections."""
+        self._check_butler_data_collections()
+        return self
+
+    def _check_butler_data_collections(self) -> None:
+        """Check that at least one Butler data collection is configured."""
         from .exceptions import FatalFaultError
 
         if len(self.butler_data_collections) == 0:
@@ -57,8 +88,51 @@ class Config(BaseSettings):
                 "at least one Data collection."
             )
 
-        return self
-
-
-config = Config()
-"""Configuration instance for sia."""
+    @classmethod
+    def from_trusted(cls, **values: Any) -> Config:
+        """Build a configuration from values that are already validated.
+
+        Field validation and environment parsing are skipped, so this must
+        only be used with values constructed in code, such as test fixtures.
+        Fields not provided take their defaults. The data collections check
+        is still applied.
+
+        Parameters
+        ----------
+        **values
+            Configuration values, keyed by field name.
+
+        Returns
+        -------
+        Config
+            The configuration instance.
+        """
+        instance = cls.model_construct(**values)
+        instance._check_butler_data_collections()  # noqa: SLF001
+        return instance
+
+
+@cache
+def get_config() -> Config:
+    """Return the configuration instance for sia.
+
+    The configuration is parsed from the environment on the first call and
+    the same instance is returned afterwards.
+
+    Returns
+    -------
+    Config
+        The configuration instance.
+    """
+    return Config()
+
+
+def __getattr__(name: str) -> Config:
+    """Provide the ``config`` module attribute on first access.
+
+    This keeps ``from sia.config import config`` working without parsing the
+    environment at import time.
+    """
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
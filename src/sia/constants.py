@@ -8,10 +8,12 @@ RESPONSEFORMATS = {"votable", "application/x-votable"}
 RESULT_NAME = "result"
 """The name of the result file."""
 
-SINGLE_PARAMS = {
-    "maxrec",
-    "responseformat",
-}
+SINGLE_PARAMS = frozenset(
+    {
+        "maxrec",
+        "responseformat",
+    }
+)
 """Parameters that should be treated as single values."""
 
 BASE_RESOURCE_IDENTIFIER = "ivo://rubin/"
@@ -14,7 +14,7 @@ from safir.dependencies.logger import logger_dependency
 from structlog.stdlib import BoundLogger
 
 from ..config import Config
-from ..factory import Factory
+from ..factory import Factory, ProcessContext
 from .labeled_butler_factory import labeled_butler_factory_dependency
 from .obscore_configs import obscore_config_dependency
 
@@ -69,7 +69,14 @@ class ContextDependency:
     """
 
     def __init__(self) -> None:
-        self._config: Config | None = None
+        self._process_context: ProcessContext | None = None
+
+    @property
+    def process_context(self) -> ProcessContext:
+        """The process context shared by all requests."""
+        if not self._process_context:
+            raise RuntimeError("ContextDependency not initialized")
+        return self._process_context
 
     async def __call__(
         self,
@@ -78,31 +85,20 @@ class ContextDependency:
         logger: Annotated[BoundLogger, Depends(logger_dependency)],
     ) -> RequestContext:
         """Create a per-request context and return it."""
-        if not self._config:
-            raise RuntimeError("ContextDependency not initialized")
-
         return RequestContext(
             request=request,
-            config=self._config,
+            config=self.process_context.config,
             logger=logger,
             factory=await self.create_factory(logger=logger),
         )
 
     async def create_factory(self, logger: BoundLogger) -> Factory:
         """Create a factory for use outside a request context."""
-        if not self._config:
-            raise RuntimeError("ContextDependency not initialized")
-
-        return Factory(
-            logger=logger,
-            config=self._config,
-            labeled_butler_factory=await labeled_butler_factory_dependency(),
-            obscore_configs=await obscore_config_dependency(),
-        )
+        return Factory(logger=logger, process_context=self.process_context)
 
     async def aclose(self) -> None:
         """Clean up the per-process configuration."""
-        self._config = None
+        self._process_context = None
 
     async def initialize(
         self,
@@ -110,12 +106,20 @@ class ContextDependency:
     ) -> None:
         """Initialize the process-wide shared context.
 
+        The Butler factory and Obscore config dependencies must already be
+        initialized. Their values are resolved once here rather than on
+        every request.
+
         Parameters
         ----------
         config
             SIA configuration.
         """
-        self._config = config
+        self._process_context = ProcessContext.create(
+            config=config,
+            labeled_butler_factory=await labeled_butler_factory_dependency(),
+            obscore_configs=await obscore_config_dependency(),
+        )
 
 
 context_dependency = ContextDependency()
@@ -19,9 +19,9 @@ class LabeledButlerFactoryDependency:
         """Initialize the dependency."""
         # Get the data repositories from the config in a format suitable for
         # the LabeledButlerFactory.
-        data_repositories = DataCollectionService(
-            config=config
-        ).get_data_repositories()
+        data_repositories = DataCollectionService.get_data_repositories(
+            config.butler_data_collections
+        )
 
         self._labeled_butler_factory = LabeledButlerFactory(
             repositories=data_repositories
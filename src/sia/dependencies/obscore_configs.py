@@ -1,5 +1,7 @@
 """Dependency class for loading the Obscore configs."""
 
+import asyncio
+
 from lsst.dax.obscore import ExporterConfig
 
 from ..config import Config
@@ -14,11 +16,24 @@ class ObscoreConfigDependency:
         self._config_mapping: dict[str, ExporterConfig] | None = None
 
     async def initialize(self, config: Config) -> None:
-        """Initialize the dependency by processing the Butler Collections."""
-        self._config_mapping = {}
-        for collection in config.butler_data_collections:
-            exporter_config = collection.get_exporter_config()
-            self._config_mapping[collection.label] = exporter_config
+        """Initialize the dependency by processing the Butler Collections.
+
+        The configs may need to be fetched from a remote URL, so they are
+        loaded concurrently in worker threads.
+        """
+        collections = config.butler_data_collections
+        exporter_configs = await asyncio.gather(
+            *(
+                asyncio.to_thread(collection.get_exporter_config)
+                for collection in collections
+            )
+        )
+        self._config_mapping = {
+            collection.label: exporter_config
+            for collection, exporter_config in zip(
+                collections, exporter_configs, strict=True
+            )
+        }
 
     async def __call__(self) -> dict[str, ExporterConfig]:
         """Return the mapping of label names to ExporterConfigs."""
@@ -1,7 +1,7 @@
 """Provides functions to get instances of params."""
 
-from collections import defaultdict
-from typing import Annotated
+from collections.abc import Iterable
+from typing import Annotated, Any
 
 from fastapi import Depends, Request
 from lsst.dax.obscore.siav2 import SIAv2Parameters
@@ -10,25 +10,55 @@ from ..constants import SINGLE_PARAMS
 from ..models.sia_query_params import SIAQueryParams
 
 
+def _group_params(items: Iterable[tuple[str, Any]]) -> dict[str, Any]:
+    """Group multi-valued form items by key.
+
+    Parameters
+    ----------
+    items
+        The ``(key, value)`` pairs of the submitted form.
+
+    Returns
+    -------
+    dict
+        Mapping of each key to its list of values, or to its first value for
+        keys listed in ``SINGLE_PARAMS``.
+
+    Raises
+    ------
+    TypeError
+        If one of the values is a file upload.
+    """
+    params: dict[str, Any] = {}
+
+    for key, value in items:
+        if not isinstance(value, str):
+            raise TypeError("File upload not supported")
+        if key in SINGLE_PARAMS:
+            params.setdefault(key, value)
+        else:
+            params.setdefault(key, []).append(value)
+
+    return params
+
+
 async def get_sia_params_dependency(
     *,
     params: Annotated[SIAQueryParams, Depends(SIAQueryParams)],
+) -> SIAv2Parameters:
+    """Parse GET parameters into SIAv2Parameters for SIA query."""
+    return params.to_butler_parameters()
+
+
+async def sia_post_params_dependency(
+    *,
     request: Request,
 ) -> SIAv2Parameters:
-    """Parse GET and POST parameters into SIAv2Parameters for SIA query."""
-    # For POST requests, use form data
-    if request.method == "POST":
-        post_params_ddict: dict[str, list[str]] = defaultdict(list)
-
-        for key, value in (await request.form()).multi_items():
-            if not isinstance(value, str):
-                raise TypeError("File upload not supported")
-            post_params_ddict[key].append(value)
-
-        post_params = {
-            key: (values[0] if key in SINGLE_PARAMS and values else values)
-            for key, values in post_params_ddict.items()
-        }
-        params = SIAQueryParams.from_dict(post_params)
+    """Parse POST parameters into SIAv2Parameters for SIA query.
 
+    The form is read directly rather than through a ``SIAQueryParams``
+    dependency, so the parameters are only built once.
+    """
+    form = await request.form()
+    params = SIAQueryParams.from_dict(_group_params(form.multi_items()))
     return params.to_butler_parameters()
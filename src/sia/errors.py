@@ -4,29 +4,32 @@ VOTAble.
 
 import functools
 from collections.abc import Callable
-from pathlib import Path
 from typing import ParamSpec, TypeVar
 
 import structlog
 from fastapi import Request, Response
 from fastapi.exceptions import RequestValidationError
-from fastapi.templating import Jinja2Templates
+from markupsafe import escape
 
-from .config import config
+from .config import get_config
 from .exceptions import DefaultFaultError, UsageFaultError, VOTableError
+from .templating import templates
 
-_TEMPLATES = Jinja2Templates(
-    directory=str(Path(__file__).resolve().parent / "templates")
-)
+_ERROR_MESSAGE_PLACEHOLDER = "__SIA_ERROR_MESSAGE__"
 
-logger = structlog.get_logger(config.name)
+_VOTABLE_ERROR_PREFIX, _VOTABLE_ERROR_SUFFIX = (
+    templates.get_template("votable_error.xml")
+    .render(error_message=_ERROR_MESSAGE_PLACEHOLDER)
+    .split(_ERROR_MESSAGE_PLACEHOLDER)
+)
+"""Error VOTable rendered once at import, split around the error message."""
 
 
 async def votable_exception_handler(
     request: Request, exc: Exception
 ) -> Response:
     """Handle exceptions that should be returned as VOTable errors.
-    Produces a VOTable error as a TemplateResponse with the error message.
+    Produces a VOTable error response with the error message.
 
     Parameters
     ----------
@@ -40,6 +43,7 @@ async def votable_exception_handler(
     Response
         The VOTAble error response.
     """
+    logger = structlog.get_logger(get_config().name)
     logger.error(
         "Error during query processing",
         error_type=type(exc).__name__,
@@ -54,17 +58,11 @@ async def votable_exception_handler(
     elif not isinstance(exc, VOTableError):
         exc = DefaultFaultError(detail=str(exc))
 
-    response = _TEMPLATES.TemplateResponse(
-        request,
-        "votable_error.xml",
-        {
-            "request": request,
-            "error_message": str(exc),
-        },
-        media_type="application/xml",
+    error_message = str(escape(str(exc)))
+    content = _VOTABLE_ERROR_PREFIX + error_message + _VOTABLE_ERROR_SUFFIX
+    return Response(
+        content=content, media_type="application/xml", status_code=400
     )
-    response.status_code = 400
-    return response
 
 
 R = TypeVar("R")  # Return type
@@ -87,11 +85,12 @@ def handle_exceptions(func: Callable[P, R]) -> Callable[P, R]:
         try:
             return func(*args, **kwargs)
         except Exception as exc:
+            logger = structlog.get_logger(get_config().name)
             logger.exception("An exception occurred during query processing")
-            if isinstance(exc, VOTableError):
-                raise exc from exc
+            # Only validation errors need translating, everything else
+            # (including VOTableError) propagates unchanged.
             if isinstance(exc, RequestValidationError):
                 raise UsageFaultError(detail=str(exc)) from exc
-            raise exc from exc
+            raise
 
     return wrapper
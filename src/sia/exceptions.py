@@ -2,25 +2,28 @@
 VOTAble.
 """
 
-from pathlib import Path
+from typing import ClassVar
 
 from fastapi.exceptions import HTTPException
-from fastapi.templating import Jinja2Templates
-
-_TEMPLATES = Jinja2Templates(
-    directory=str(Path(__file__).resolve().parent / "templates")
-)
-
 
 # Module may be slightly too long, in the future we may want to break it up
 
 
 class VOTableError(HTTPException):
-    """Exception for VOTable errors."""
+    """Exception for VOTable errors.
+
+    Subclasses set ``fault`` to the IVOA fault name, which is prepended to
+    the detail message.
+    """
+
+    fault: ClassVar[str | None] = None
+    """The IVOA fault name used to prefix the detail, if any."""
 
     def __init__(
         self, detail: str = "Uknown error occured", status_code: int = 400
     ) -> None:
+        if self.fault:
+            detail = f"{self.fault}: {detail}"
         super().__init__(detail=detail, status_code=status_code)
 
     def __str__(self) -> str:
@@ -38,12 +41,12 @@ class UsageFaultError(VOTableError):
         The status code for the exception
     """
 
+    fault = "UsageFault"
+
     def __init__(
         self, detail: str = "Invalid input", status_code: int = 400
     ) -> None:
-        self.detail = f"UsageFault: {detail}"
-        self.status_code = status_code
-        super().__init__(detail=self.detail, status_code=self.status_code)
+        super().__init__(detail=detail, status_code=status_code)
 
 
 class TransientFaultError(VOTableError):
@@ -57,14 +60,14 @@ class TransientFaultError(VOTableError):
         The status code for the exception
     """
 
+    fault = "TransientFault"
+
     def __init__(
         self,
         detail: str = "Service is not currently able to function",
         status_code: int = 400,
     ) -> None:
-        self.detail = f"TransientFault: {detail}"
-        self.status_code = status_code
-        super().__init__(detail=self.detail, status_code=self.status_code)
+        super().__init__(detail=detail, status_code=status_code)
 
 
 class FatalFaultError(VOTableError):
@@ -78,14 +81,14 @@ class FatalFaultError(VOTableError):
         The status code for the exception
     """
 
+    fault = "FatalFault"
+
     def __init__(
         self,
         detail: str = "Service cannot perform requested action",
         status_code: int = 400,
     ) -> None:
-        self.detail = f"FatalFault: {detail}"
-        self.status_code = status_code
-        super().__init__(detail=self.detail, status_code=self.status_code)
+        super().__init__(detail=detail, status_code=status_code)
 
 
 class DefaultFaultError(VOTableError):
@@ -99,9 +102,9 @@ class DefaultFaultError(VOTableError):
         The status code for the exception
     """
 
+    fault = "DefaultFault"
+
     def __init__(
         self, detail: str = "General error", status_code: int = 400
     ) -> None:
-        self.detail = f"DefaultFault: {detail}"
-        self.status_code = status_code
-        super().__init__(detail=self.detail, status_code=self.status_code)
+        super().__init__(detail=detail, status_code=status_code)
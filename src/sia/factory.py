@@ -9,41 +9,138 @@ from structlog.stdlib import BoundLogger
 
 from .config import Config
 from .models.data_collections import ButlerDataCollection
+from .services.availability import AvailabilityCache
 from .services.data_collections import DataCollectionService
+from .services.document_cache import DocumentCache
+from .services.query_coalescer import QueryCoalescer
 
-__all__ = ["Factory"]
+__all__ = ["Factory", "ProcessContext"]
 
+_DOCUMENT_CACHE_SIZE = 128
+"""Maximum number of rendered documents of each kind to cache."""
 
-class Factory:
-    """Component factory for sia.
 
-    Uses the contents of a `ProcessContext` to construct the components of an
-    application on demand.
+class ProcessContext:
+    """Per-process application context.
+
+    This object caches all of the per-process singletons that can be reused
+    for every request. Services and caches whose state must outlive a single
+    request are held here, and the `Factory` hands the same instances to
+    every request.
 
     Parameters
     ----------
     config
-        The configuration instance
+        SIA configuration.
     labeled_butler_factory
-        The LabeledButlerFactory singleton
+        The LabeledButlerFactory singleton.
     obscore_configs
-        The Obscore configurations
-    logger
-        The logger instance
+        The Obscore configurations, keyed by collection label.
+    data_collection_service
+        The data collection service, shared by all requests.
+    availability_cache
+        The cache of VOSI availability documents, shared by all requests.
+    query_coalescer
+        Shares results between identical concurrent queries, if enabled.
+    instrument_cache
+        Instrument names of each collection's repository, keyed by label.
+    capabilities_cache
+        Rendered VOSI capabilities documents.
+    self_description_cache
+        Rendered self-description documents.
     """
 
     def __init__(
         self,
+        *,
+        config: Config,
+        labeled_butler_factory: LabeledButlerFactory,
+        obscore_configs: dict[str, ExporterConfig],
+        data_collection_service: DataCollectionService,
+        availability_cache: AvailabilityCache,
+        query_coalescer: QueryCoalescer | None,
+        instrument_cache: dict[str, list[str]],
+        capabilities_cache: DocumentCache,
+        self_description_cache: DocumentCache,
+    ) -> None:
+        self.config = config
+        self.labeled_butler_factory = labeled_butler_factory
+        self.obscore_configs = obscore_configs
+        self.data_collection_service = data_collection_service
+        self.availability_cache = availability_cache
+        self.query_coalescer = query_coalescer
+        self.instrument_cache = instrument_cache
+        self.capabilities_cache = capabilities_cache
+        self.self_description_cache = self_description_cache
+
+    @classmethod
+    def create(
+        cls,
         config: Config,
         labeled_butler_factory: LabeledButlerFactory,
         obscore_configs: dict[str, ExporterConfig],
+    ) -> ProcessContext:
+        """Create a new process context from the SIA configuration.
+
+        Parameters
+        ----------
+        config
+            SIA configuration.
+        labeled_butler_factory
+            The LabeledButlerFactory singleton.
+        obscore_configs
+            The Obscore configurations, keyed by collection label.
+
+        Returns
+        -------
+        ProcessContext
+            Shared context for a SIA process.
+        """
+        return cls(
+            config=config,
+            labeled_butler_factory=labeled_butler_factory,
+            obscore_configs=obscore_configs,
+            data_collection_service=DataCollectionService(config=config),
+            availability_cache=AvailabilityCache(
+                ttl=config.availability_cache_ttl
+            ),
+            query_coalescer=(
+                QueryCoalescer() if config.query_coalescing else None
+            ),
+            instrument_cache={},
+            capabilities_cache=DocumentCache(max_size=_DOCUMENT_CACHE_SIZE),
+            self_description_cache=DocumentCache(
+                max_size=_DOCUMENT_CACHE_SIZE
+            ),
+        )
+
+
+class Factory:
+    """Component factory for sia.
+
+    Uses the contents of a `ProcessContext` to construct the components of an
+    application on demand.
+
+    Parameters
+    ----------
+    process_context
+        Shared process context.
+    logger
+        The logger instance
+    """
+
+    __slots__ = ("_context", "_logger")
+
+    def __init__(
+        self,
+        process_context: ProcessContext,
         logger: BoundLogger | None = None,
     ) -> None:
-        self._config = config
-        self._labeled_butler_factory = labeled_butler_factory
-        self._obscore_configs = obscore_configs
+        self._context = process_context
         self._logger = (
-            logger if logger else structlog.get_logger(self._config.name)
+            logger
+            if logger
+            else structlog.get_logger(self._context.config.name)
         )
 
     def create_butler(
@@ -65,7 +162,7 @@ class Factory:
         Butler
             The Butler instance.
         """
-        return self._labeled_butler_factory.create_butler(
+        return self._context.labeled_butler_factory.create_butler(
             label=butler_collection.label, access_token=token
         )
 
@@ -82,7 +179,7 @@ class Factory:
         ExporterConfig
             The Obscore config.
         """
-        return self._obscore_configs[label]
+        return self._context.obscore_configs[label]
 
     def create_data_collection_service(self) -> DataCollectionService:
         """Create a data collection service.
@@ -92,9 +189,57 @@ class Factory:
         DataCollectionService
             The data collection service.
         """
-        return DataCollectionService(
-            config=self._config,
-        )
+        return self._context.data_collection_service
+
+    def create_availability_cache(self) -> AvailabilityCache:
+        """Create a VOSI availability cache.
+
+        Returns
+        -------
+        AvailabilityCache
+            The availability cache.
+        """
+        return self._context.availability_cache
+
+    def create_query_coalescer(self) -> QueryCoalescer | None:
+        """Create a coalescer for identical concurrent queries.
+
+        Returns
+        -------
+        QueryCoalescer or None
+            The query coalescer, or `None` if coalescing is disabled.
+        """
+        return self._context.query_coalescer
+
+    def create_instrument_cache(self) -> dict[str, list[str]]:
+        """Create a cache of instrument names, keyed by collection label.
+
+        Returns
+        -------
+        dict of str to list of str
+            The instrument cache.
+        """
+        return self._context.instrument_cache
+
+    def create_capabilities_cache(self) -> DocumentCache:
+        """Create a cache of rendered VOSI capabilities documents.
+
+        Returns
+        -------
+        DocumentCache
+            The capabilities document cache.
+        """
+        return self._context.capabilities_cache
+
+    def create_self_description_cache(self) -> DocumentCache:
+        """Create a cache of rendered self-description documents.
+
+        Returns
+        -------
+        DocumentCache
+            The self-description document cache.
+        """
+        return self._context.self_description_cache
 
     def set_logger(self, logger: BoundLogger) -> None:
         """Replace the internal logger.
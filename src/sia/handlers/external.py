@@ -1,14 +1,14 @@
 """Handlers for the app's external root, ``/api/sia/``."""
 
-from pathlib import Path
+from functools import cache, partial
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request, Response
-from fastapi.templating import Jinja2Templates
 from lsst.dax.obscore.siav2 import SIAv2Parameters, siav2_query
 from safir.dependencies.logger import logger_dependency
 from safir.metadata import get_metadata
 from safir.models import ErrorModel
+from starlette.concurrency import run_in_threadpool
 from structlog.stdlib import BoundLogger
 from vo_models.vosi.availability import Availability
 from vo_models.vosi.capabilities.models import VOSICapabilities
@@ -16,16 +16,17 @@ from vo_models.vosi.capabilities.models import VOSICapabilities
 from ..config import config
 from ..dependencies.context import RequestContext, context_dependency
 from ..dependencies.data_collections import validate_collection
-from ..dependencies.query_params import get_sia_params_dependency
+from ..dependencies.query_params import (
+    get_sia_params_dependency,
+    sia_post_params_dependency,
+)
 from ..dependencies.token import optional_auth_delegated_token_dependency
 from ..models.data_collections import ButlerDataCollection
 from ..models.index import Index
-from ..services.availability import AvailabilityService
-from ..services.data_collections import DataCollectionService
 from ..services.response_handler import ResponseHandlerService
+from ..templating import templates
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-_TEMPLATES = Jinja2Templates(directory=str(Path(BASE_DIR, "templates")))
+_CAPABILITIES_TEMPLATE = templates.get_template("capabilities.xml")
 
 __all__ = ["external_router", "get_index"]
 
@@ -61,6 +62,12 @@ async def get_index(
     # logger for more complex logging.
     logger.info("Request for application metadata")
 
+    return _get_index()
+
+
+@cache
+def _get_index() -> Index:
+    """Return the response for the external root, built only once."""
     metadata = get_metadata(
         package_name="sia",
         application_name=config.name,
@@ -89,18 +96,13 @@ async def get_index(
     },
     summary="IVOA service availability",
 )
-async def get_availability(collection_name: str) -> Response:
-    # Get the butler data collection
-    collection = DataCollectionService(
-        config=config
-    ).get_data_collection_by_name(name=collection_name)
-
-    # Check if it is available
-    availability = await AvailabilityService(
-        collection=collection
-    ).get_availability()
-
-    xml = availability.to_xml(skip_empty=True)
+async def get_availability(
+    context: Annotated[RequestContext, Depends(context_dependency)],
+    collection: Annotated[ButlerDataCollection, Depends(validate_collection)],
+) -> Response:
+    # Check if it is available, reusing a recent check if there is one
+    availability_cache = context.factory.create_availability_cache()
+    xml = await availability_cache.get_availability_xml(collection)
     return Response(content=xml, media_type="application/xml")
 
 
@@ -131,26 +133,30 @@ async def get_availability(collection_name: str) -> Response:
     summary="IVOA service capabilities",
 )
 async def get_capabilities(
+    *,
+    context: Annotated[RequestContext, Depends(context_dependency)],
     collection_name: str,
     request: Request,
 ) -> Response:
-    return _TEMPLATES.TemplateResponse(
-        request,
-        "capabilities.xml",
-        {
-            "request": request,
-            "availability_url": request.url_for(
+    # The document only depends on the endpoint URLs, which are fixed for a
+    # given base URL and collection, so the route table is only searched
+    # and the template only rendered on a cache miss.
+    cache = context.factory.create_capabilities_cache()
+    xml = cache.get(
+        (str(request.base_url), collection_name),
+        lambda: _CAPABILITIES_TEMPLATE.render(
+            availability_url=request.url_for(
                 "get_availability", collection_name=collection_name
             ),
-            "capabilities_url": request.url_for(
+            capabilities_url=request.url_for(
                 "get_capabilities", collection_name=collection_name
             ),
-            "query_url": request.url_for(
+            query_url=request.url_for(
                 "query", collection_name=collection_name
             ),
-        },
-        media_type="application/xml",
+        ).encode(),
     )
+    return Response(content=xml, media_type="application/xml")
 
 
 @external_router.get(
@@ -165,6 +171,23 @@ async def get_capabilities(
     },
     summary="IVOA SIA service query",
 )
+async def query(
+    *,
+    context: Annotated[RequestContext, Depends(context_dependency)],
+    collection: Annotated[ButlerDataCollection, Depends(validate_collection)],
+    params: Annotated[SIAv2Parameters, Depends(get_sia_params_dependency)],
+    delegated_token: Annotated[
+        str | None, Depends(optional_auth_delegated_token_dependency)
+    ],
+) -> Response:
+    return await _process_query(
+        context=context,
+        collection=collection,
+        params=params,
+        token=delegated_token,
+    )
+
+
 @external_router.post(
     "/{collection_name}/query",
     description="Query endpoint for the SIA service (POST method).",
@@ -177,20 +200,53 @@ async def get_capabilities(
     },
     summary="IVOA SIA (v2) service query (POST)",
 )
-def query(
+async def query_post(
     *,
     context: Annotated[RequestContext, Depends(context_dependency)],
     collection: Annotated[ButlerDataCollection, Depends(validate_collection)],
-    params: Annotated[SIAv2Parameters, Depends(get_sia_params_dependency)],
+    params: Annotated[SIAv2Parameters, Depends(sia_post_params_dependency)],
     delegated_token: Annotated[
         str | None, Depends(optional_auth_delegated_token_dependency)
     ],
 ) -> Response:
-    return ResponseHandlerService.process_query(
-        factory=context.factory,
+    return await _process_query(
+        context=context,
+        collection=collection,
         params=params,
         token=delegated_token,
+    )
+
+
+async def _process_query(
+    *,
+    context: RequestContext,
+    collection: ButlerDataCollection,
+    params: SIAv2Parameters,
+    token: str | None,
+) -> Response:
+    """Run a SIA query in the threadpool.
+
+    If query coalescing is enabled, a query identical to one already running
+    for the same collection, credentials and base URL waits for that query's
+    response instead of running again.
+    """
+    process_query = partial(
+        ResponseHandlerService.process_query,
+        factory=context.factory,
+        params=params,
+        token=token,
         sia_query=siav2_query,
         collection=collection,
         request=context.request,
     )
+    query = partial(run_in_threadpool, process_query)
+    coalescer = context.factory.create_query_coalescer()
+    if coalescer is None:
+        return await query()
+    key = (
+        collection.name,
+        token,
+        str(context.request.base_url),
+        params.model_dump_json(),
+    )
+    return await coalescer.run(key, query)
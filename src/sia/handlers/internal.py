@@ -8,6 +8,8 @@ These handlers should be used for monitoring, health checks, internal status,
 or other information that should not be visible outside the Kubernetes cluster.
 """
 
+from functools import cache
+
 from fastapi import APIRouter
 from safir.metadata import Metadata, get_metadata
 
@@ -35,6 +37,12 @@ async def get_index() -> Metadata:
 
     By convention, this endpoint returns only the application's metadata.
     """
+    return _get_metadata()
+
+
+@cache
+def _get_metadata() -> Metadata:
+    """Return the installed package's metadata, gathered only once."""
     return get_metadata(
         package_name="sia",
         application_name=config.name,
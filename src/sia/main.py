@@ -12,8 +12,10 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from importlib.metadata import metadata, version
 
+from anyio.to_thread import current_default_thread_limiter
 from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.utils import get_openapi
 from safir.dependencies.http_client import http_client_dependency
 from safir.logging import configure_logging, configure_uvicorn_logging
@@ -44,6 +46,8 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Set up and tear down the application."""
     logger.debug("SIA has started up.")
+    # Queries run in the default thread pool, so it bounds query concurrency.
+    current_default_thread_limiter().total_tokens = config.thread_pool_size
     await labeled_butler_factory_dependency.initialize(config=config)
     await obscore_config_dependency.initialize(config=config)
     await context_dependency.initialize(config=config)
@@ -104,9 +108,16 @@ def configure_exception_handlers(app: FastAPI) -> None:
 
 
 # Address case-sensitivity issue with IVOA query parameters
-app.add_middleware(CaseInsensitiveFormMiddleware)
+app.add_middleware(
+    CaseInsensitiveFormMiddleware, max_body_size=config.max_form_body_size
+)
 app.add_middleware(CaseInsensitiveQueryMiddleware)
 
+# VOTables compress very well, so compress larger responses for clients that
+# accept it. The lowest level keeps most of the size reduction for a fraction
+# of the CPU cost of the default.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # Configure exception handlers.
 configure_exception_handlers(app)
 
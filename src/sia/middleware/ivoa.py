@@ -1,8 +1,8 @@
 """Middleware for IVOA services."""
 
-from copy import copy
-from urllib.parse import parse_qsl, urlencode
+from urllib.parse import quote_plus, unquote_plus
 
+from fastapi import HTTPException
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 __all__ = ["CaseInsensitiveFormMiddleware"]
@@ -17,15 +17,18 @@ class CaseInsensitiveFormMiddleware:
     FastAPI to perform input validation on the POST parameters.
     """
 
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(self, app: ASGIApp, *, max_body_size: int = 65536) -> None:
         """Initialize the middleware with the ASGI application.
 
         Parameters
         ----------
         app
             The ASGI application to wrap.
+        max_body_size
+            Maximum size in bytes of a form body that will be read.
         """
         self._app = app
+        self._max_body_size = max_body_size
 
     async def __call__(
         self, scope: Scope, receive: Receive, send: Send
@@ -37,8 +40,6 @@ class CaseInsensitiveFormMiddleware:
             await self._app(scope, receive, send)
             return
 
-        scope = copy(scope)
-
         if scope["method"] == "POST" and self.is_form_data(scope):
             receive = self.wrapped_receive(receive)
 
@@ -58,34 +59,45 @@ class CaseInsensitiveFormMiddleware:
         bool
             True if the request contains form data, False otherwise.
         """
-        headers = {
-            k.decode("latin-1"): v.decode("latin-1")
-            for k, v in scope.get("headers", [])
-        }
-        content_type = headers.get("content-type", "")
-        return content_type.startswith("application/x-www-form-urlencoded")
+        # ASGI header names are lowercase bytes, so no decoding is needed.
+        for key, value in scope.get("headers", []):
+            if key == b"content-type":
+                return value.startswith(b"application/x-www-form-urlencoded")
+        return False
 
     @staticmethod
-    async def get_body(receive: Receive) -> bytes:
+    async def get_body(receive: Receive, max_size: int) -> bytes:
         """Read the entire request body.
 
         Parameters
         ----------
         receive
             The receive function to read messages from.
+        max_size
+            Maximum size of the body in bytes.
 
         Returns
         -------
         bytes
             The entire request body.
+
+        Raises
+        ------
+        HTTPException
+            If the body is larger than ``max_size``.
         """
-        body = b""
+        body = bytearray()
         more_body = True
         while more_body:
             message = await receive()
-            body += message.get("body", b"")
+            body.extend(message.get("body", b""))
+            if len(body) > max_size:
+                raise HTTPException(
+                    status_code=413,
+                    detail="Form body too large",
+                )
             more_body = message.get("more_body", False)
-        return body
+        return bytes(body)
 
     @staticmethod
     async def process_form_data(body: bytes) -> bytes:
@@ -101,11 +113,21 @@ class CaseInsensitiveFormMiddleware:
         bytes
             The processed request body with lowercased keys.
         """
-        body_str = body.decode("utf-8")
-        parsed = parse_qsl(body_str)
-        lowercased = [(key.lower(), value) for key, value in parsed]
-        processed = urlencode(lowercased)
-        return processed.encode("utf-8")
+        # Only the keys change, so work on the raw bytes rather than decoding
+        # and re-encoding every value. As with parse_qsl, fields with no value
+        # are dropped.
+        fields = []
+        for field in body.split(b"&"):
+            key, sep, value = field.partition(b"=")
+            if not value:
+                continue
+            if b"%" in key or b"+" in key:
+                # Escaped characters must be decoded to be lowercased.
+                key = quote_plus(unquote_plus(key.decode()).lower()).encode()
+            else:
+                key = key.lower()
+            fields.append(key + sep + value)
+        return b"&".join(fields)
 
     def wrapped_receive(self, receive: Receive) -> Receive:
         """Wrap the receive function to process form data.
@@ -123,7 +145,7 @@ class CaseInsensitiveFormMiddleware:
 
         async def inner() -> dict:
             """Process the form data and return the request."""
-            body = await self.get_body(receive)
+            body = await self.get_body(receive, self._max_body_size)
             processed_body = await self.process_form_data(body)
             return {
                 "type": "http.request",
@@ -1,6 +1,7 @@
 """Common models used by in different places in the application."""
 
 from enum import Enum
+from functools import cache
 from typing import TypeVar
 
 T = TypeVar("T", bound="CaseInsensitiveEnum")
@@ -30,8 +31,19 @@ class CaseInsensitiveEnum(Enum):
         if not isinstance(value, str):
             return None
 
-        for member in cls:
-            if member.value.lower() == value.lower():
-                return member
+        # functools.cache does not preserve the generic signature.
+        members: dict[str, T] = _lowercase_members(cls)
+        member = members.get(value.lower())
+        if member is None:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+        return member
 
-        raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+
+@cache
+def _lowercase_members(cls: type[T]) -> dict[str, T]:
+    """Map the lowercased values of a case-insensitive Enum to its members.
+
+    Built on the first lookup that misses the exact value, since Enum
+    members are only available once the class has been created.
+    """
+    return {member.value.lower(): member for member in cls}
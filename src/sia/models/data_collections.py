@@ -12,7 +12,7 @@ from pydantic import Field, HttpUrl
 from ..models.butler_type import ButlerType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ButlerDataCollection:
     """Model to represent a Remote Butler data collection."""
 
@@ -105,12 +105,13 @@ class ButlerDataCollection:
         config_data = ButlerConfig(str(self.config))
         exporter_config = ExporterConfig.model_validate(config_data)
         # Overwrite datalink format if provided
-        for name in exporter_config.dataset_types:
+        if self.datalink_url is None:
+            return exporter_config
+        datalink_url_fmt = str(self.datalink_url)
+        for dataset_type in exporter_config.dataset_types.values():
             with contextlib.suppress(AttributeError):
                 # We normally should find the datalink_url_fmt attribute
                 # If it doesn't exist this doesn't seem to be a critical issue
                 # so we suppress the AttributeError
-                exporter_config.dataset_types[name].datalink_url_fmt = str(
-                    self.datalink_url
-                )
+                dataset_type.datalink_url_fmt = datalink_url_fmt
         return exporter_config
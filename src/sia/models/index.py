@@ -1,6 +1,6 @@
 """Data models for the top-level route."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from safir.metadata import Metadata as SafirMetadata
 
 __all__ = ["Index"]
@@ -17,4 +17,6 @@ class Index(BaseModel):
     root.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     metadata: SafirMetadata = Field(..., title="Package metadata")
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 from numbers import Integral
 from typing import Annotated, Any, Self, TypeVar, cast
@@ -69,6 +69,8 @@ class Polarization(CaseInsensitiveEnum):
 class BaseQueryParams(ABC):
     """Base class for query parameters."""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_butler_parameters(self) -> Any:
         """Convert the query parameters  vto the format expected by the
@@ -76,7 +78,7 @@ class BaseQueryParams(ABC):
         """
 
 
-@dataclass
+@dataclass(slots=True)
 class SIAQueryParams(BaseQueryParams):
     """A class to represent the parameters for an SIA query.
 
@@ -309,16 +311,18 @@ class SIAQueryParams(BaseQueryParams):
         -------
         SIAQueryParams
             Instance of SIAQueryParams initialized with the provided data.
+            Keys that are not query parameters are ignored, as they are for
+            GET requests.
         """
-        return cls(**data)
+        # Every field defaults to None, so the fields can be passed
+        # positionally in declaration order. This breaks if a field is ever
+        # made keyword-only or excluded from __init__, which
+        # test_sia_params_fields_are_positional guards against.
+        return cls(*(data.get(name) for name in _FIELD_NAMES))
 
     def all_params_none(self) -> bool:
         """Check if all params except maxrec and responseformat are None."""
-        return all(
-            getattr(self, attr) is None
-            for attr in self.__annotations__
-            if attr not in ["maxrec", "responseformat"]
-        )
+        return all(getattr(self, attr) is None for attr in _TRIGGER_FIELDS)
 
     def __post_init__(self) -> None:
         """Validate the form parameters."""
@@ -333,9 +337,13 @@ class SIAQueryParams(BaseQueryParams):
         Returns
         -------
         dict
-            The query parameters as a dictionary.
+            The query parameters as a dictionary. Values are not copied.
         """
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {
+            name: value
+            for name in _FIELD_NAMES
+            if (value := getattr(self, name)) is not None
+        }
 
     def to_butler_parameters(self) -> SIAv2Parameters:
         """Convert the query parameters to SIAv2Parameters. Exclude None
@@ -380,4 +388,17 @@ class SIAQueryParams(BaseQueryParams):
         """
         if calib is None:
             return ()
-        return cast(list[Integral], [int(level.value) for level in calib])
+        # CalibLevel members are ints already, int() also accepts the raw
+        # strings passed through from POST forms.
+        return cast(
+            "tuple[Integral, ...]", tuple(int(level) for level in calib)
+        )
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(SIAQueryParams))
+"""Names of the SIAQueryParams fields, in declaration order."""
+
+_TRIGGER_FIELDS = tuple(
+    name for name in _FIELD_NAMES if name not in {"maxrec", "responseformat"}
+)
+"""Fields that, if any is set, make a request an actual query."""
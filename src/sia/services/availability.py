@@ -1,14 +1,26 @@
 """Service for checking the availability of the system."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import timedelta
 
-from httpx import AsyncClient
+from httpx import HTTPError
+from safir.dependencies.http_client import http_client_dependency
 from vo_models.vosi.availability import Availability
 
 from ..exceptions import FatalFaultError
 from ..models.butler_type import ButlerType
 from ..models.data_collections import ButlerDataCollection
 
+_CHECK_TIMEOUT = 5.0
+"""Timeout in seconds for checking the availability of a remote Butler.
+
+The shared HTTP client's default timeout is much longer, and a hung Butler
+would hold every availability request waiting on the check.
+"""
+
 
 class AvailabilityChecker(ABC):
     """Base class for availability checkers."""
@@ -62,7 +74,7 @@ class RemoteButlerAvailabilityChecker(AvailabilityChecker):
     ) -> Availability:
         """Check the availability of a remote Butler based service.
         This checks if the remote Butler is available by sending a GET request
-        to the root URL of the remote Butler.
+        to the root URL of the remote Butler, using the shared HTTP client.
 
         Parameters
         ----------
@@ -74,17 +86,36 @@ class RemoteButlerAvailabilityChecker(AvailabilityChecker):
         Availability
             The availability of the remote Butler based service.
         """
-        async with AsyncClient() as client:
-            try:
-                repository = collection.repository
-                r = await client.get(str(repository)) if repository else None
-                if not r:
-                    return Availability(available=False)
+        client = await http_client_dependency()
+        try:
+            repository = collection.repository
+            r = (
+                await client.get(str(repository), timeout=_CHECK_TIMEOUT)
+                if repository
+                else None
+            )
+            if not r:
+                return Availability(available=False)
+
+            return Availability(available=r.status_code == 200)
+
+        except HTTPError as exc:
+            return Availability(
+                note=[f"Butler check failed: {type(exc).__name__}"],
+                available=False,
+            )
+        except (KeyError, ValueError, FatalFaultError) as exc:
+            return Availability(note=[str(exc)], available=False)
 
-                return Availability(available=r.status_code == 200)
 
-            except (KeyError, ValueError, FatalFaultError) as exc:
-                return Availability(note=[str(exc)], available=False)
+_CHECKERS: dict[ButlerType, AvailabilityChecker] = {
+    ButlerType.DIRECT: DirectButlerAvailabilityChecker(),
+    ButlerType.REMOTE: RemoteButlerAvailabilityChecker(),
+}
+"""Availability checkers by Butler type.
+
+Checkers hold no state, so one instance of each is shared by all services.
+"""
 
 
 class AvailabilityService:
@@ -92,10 +123,6 @@ class AvailabilityService:
 
     def __init__(self, *, collection: ButlerDataCollection) -> None:
         self._collection = collection
-        self._checkers: dict[ButlerType, AvailabilityChecker] = {
-            ButlerType.DIRECT: DirectButlerAvailabilityChecker(),
-            ButlerType.REMOTE: RemoteButlerAvailabilityChecker(),
-        }
 
     async def get_availability(self) -> Availability:
         """Check the availability of the system.
@@ -106,10 +133,64 @@ class AvailabilityService:
             The availability of the service.
         """
         butler_type = self._collection.butler_type
-        checker = self._checkers.get(butler_type)
+        checker = _CHECKERS.get(butler_type)
         if checker:
             return await checker.check_availability(
                 collection=self._collection
             )
         else:
             return Availability(note=["Unknown Butler type"], available=False)
+
+
+class AvailabilityCache:
+    """Cache of serialized availability documents, keyed by collection name.
+
+    Availability is rechecked at most once per collection per TTL.
+    Concurrent requests that miss the cache wait for a single check rather
+    than each checking the underlying Butler.
+
+    Parameters
+    ----------
+    ttl
+        How long a cached availability document is served before the
+        availability is checked again.
+    """
+
+    def __init__(self, *, ttl: timedelta) -> None:
+        self._ttl = ttl.total_seconds()
+        self._entries: dict[str, tuple[float, str | bytes]] = {}
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def get_availability_xml(
+        self, collection: ButlerDataCollection
+    ) -> str | bytes:
+        """Return the serialized availability of a collection.
+
+        Parameters
+        ----------
+        collection
+            The ButlerDataCollection instance
+
+        Returns
+        -------
+        str or bytes
+            The VOSI availability document for the collection.
+        """
+        name = collection.name
+        entry = self._entries.get(name)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+
+        async with self._locks[name]:
+            # Another request may have refreshed the entry while this one
+            # was waiting for the lock.
+            entry = self._entries.get(name)
+            if entry and time.monotonic() < entry[0]:
+                return entry[1]
+
+            availability = await AvailabilityService(
+                collection=collection
+            ).get_availability()
+            xml = availability.to_xml(skip_empty=True)
+            self._entries[name] = (time.monotonic() + self._ttl, xml)
+            return xml
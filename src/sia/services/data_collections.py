@@ -1,24 +1,50 @@
 """Data collection helper service."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..config import Config
 from ..models.data_collections import ButlerDataCollection
 
 
-@dataclass
+@dataclass(slots=True)
 class DataCollectionService:
     """Data Collection service class."""
 
     config: Config
     """The configuration object for the data collection."""
 
+    _collections_by_label: dict[str, ButlerDataCollection] = field(
+        init=False, repr=False
+    )
+    """Data collections keyed by upper-cased label."""
+
+    _collections_by_name: dict[str, ButlerDataCollection] = field(
+        init=False, repr=False
+    )
+    """Data collections keyed by upper-cased name."""
+
+    def __post_init__(self) -> None:
+        """Index the data collections by label and by name.
+
+        Lookups are case-insensitive, and the first collection in the
+        configuration wins if two share a label or name.
+        """
+        self._collections_by_label = {}
+        self._collections_by_name = {}
+        for collection in self.config.butler_data_collections:
+            self._collections_by_label.setdefault(
+                collection.label.upper(), collection
+            )
+            self._collections_by_name.setdefault(
+                collection.name.upper(), collection
+            )
+
+    @staticmethod
     def _get_data_collection(
-        self,
         *,
         key: str,
         value: str,
-        attribute: str,
+        collections: dict[str, ButlerDataCollection],
     ) -> ButlerDataCollection:
         """Return the Data collection for the given attribute and value.
 
@@ -28,8 +54,9 @@ class DataCollectionService:
             The name of the attribute being searched (for error messages).
         value
             The value to search for.
-        attribute
-            The attribute of ButlerDataCollection to match against.
+        collections
+            The index of data collections to search, keyed by upper-cased
+            attribute value.
 
         Returns
         -------
@@ -46,13 +73,12 @@ class DataCollectionService:
         if not value:
             raise ValueError(f"{key.capitalize()} is required.")
 
-        for collection in self.config.butler_data_collections:
-            if getattr(collection, attribute).upper() == value.upper():
-                return collection
-
-        raise KeyError(
-            f"{key.capitalize()} {value} not found in Data collections."
-        )
+        try:
+            return collections[value.upper()]
+        except KeyError:
+            raise KeyError(
+                f"{key.capitalize()} {value} not found in Data collections."
+            ) from None
 
     def get_data_collection_by_label(
         self,
@@ -79,7 +105,7 @@ class DataCollectionService:
             If the label is not found in the Data collections.
         """
         return self._get_data_collection(
-            key="label", value=label, attribute="label"
+            key="label", value=label, collections=self._collections_by_label
         )
 
     def get_data_collection_by_name(
@@ -108,26 +134,28 @@ class DataCollectionService:
             If the label is not found in the Data collections.
         """
         return self._get_data_collection(
-            key="name", value=name, attribute="name"
+            key="name", value=name, collections=self._collections_by_name
         )
 
-    def get_data_repositories(self) -> dict[str, str]:
-        """Read the Data repositories from config and return a dictionary
-        mapping labels to repository URLs.
+    @staticmethod
+    def get_data_repositories(
+        collections: list[ButlerDataCollection],
+    ) -> dict[str, str]:
+        """Return a dictionary mapping labels to repository URLs.
         This is used to populate the LabeledButlerFactory.
 
+        Parameters
+        ----------
+        collections
+            The Butler data collections, usually from the configuration.
+
         Returns
         -------
         dict
             A dictionary mapping labels to repository URLs.
         """
-        butler_repos = {}
-
-        for collection in self.config.butler_data_collections:
-            label = collection.label
-            repository = collection.repository
-
-            if label and repository:
-                butler_repos[label] = str(repository)
-
-        return butler_repos
+        return {
+            collection.label: str(collection.repository)
+            for collection in collections
+            if collection.label and collection.repository
+        }
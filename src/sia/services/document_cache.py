@@ -0,0 +1,57 @@
+"""Cache of rendered documents."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+
+__all__ = ["DocumentCache"]
+
+
+class DocumentCache:
+    """Bounded cache of rendered documents.
+
+    Keys usually include the URL the client used, so the number of cached
+    documents is bounded and the least recently used one is evicted first.
+    The cache may be used from the threadpool as well as the event loop.
+
+    Parameters
+    ----------
+    max_size
+        Maximum number of documents to cache.
+    """
+
+    def __init__(self, *, max_size: int) -> None:
+        self._max_size = max_size
+        self._documents: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, render: Callable[[], bytes]) -> bytes:
+        """Return a cached document, rendering it on a cache miss.
+
+        Parameters
+        ----------
+        key
+            Key identifying the document. It must include everything the
+            document depends on.
+        render
+            Function rendering the document.
+
+        Returns
+        -------
+        bytes
+            The rendered document.
+        """
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                return document
+
+        # Render outside the lock. Concurrent misses may render the same
+        # document twice, which is harmless.
+        document = render()
+        with self._lock:
+            self._documents[key] = document
+            if len(self._documents) > self._max_size:
+                self._documents.popitem(last=False)
+        return document
@@ -0,0 +1,104 @@
+"""Service for sharing the results of identical concurrent queries."""
+
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from starlette.responses import Response
+
+__all__ = ["QueryCoalescer"]
+
+
+@dataclass(frozen=True, slots=True)
+class _QueryResult:
+    """Immutable result of a query, shared between coalesced requests."""
+
+    status_code: int
+    """HTTP status code of the response."""
+
+    headers: tuple[tuple[bytes, bytes], ...]
+    """Raw headers of the response."""
+
+    body: bytes
+    """Body of the response."""
+
+    @classmethod
+    def from_response(cls, response: Response) -> "_QueryResult":
+        """Capture the result of a query from its response."""
+        return cls(
+            status_code=response.status_code,
+            headers=tuple(response.raw_headers),
+            body=bytes(response.body),
+        )
+
+    def to_response(self) -> Response:
+        """Build a new response for one of the requests sharing the result."""
+        response = Response(content=self.body, status_code=self.status_code)
+        response.raw_headers = list(self.headers)
+        return response
+
+
+class QueryCoalescer:
+    """Share one execution between identical queries running concurrently.
+
+    The first request for a key starts the query; requests for the same key
+    that arrive while it is still running wait for its result. Only the
+    status, headers and body are shared, and every request gets its own
+    response object, since middleware such as gzip compression modifies the
+    response it sends. Nothing is cached once the query finishes.
+    """
+
+    def __init__(self) -> None:
+        self._running: dict[Hashable, asyncio.Task[_QueryResult]] = {}
+
+    async def run(
+        self,
+        key: Hashable,
+        query: Callable[[], Coroutine[Any, Any, Response]],
+    ) -> Response:
+        """Run a query, or wait for an identical one already running.
+
+        Parameters
+        ----------
+        key
+            Key identifying the query. It must include everything the
+            response depends on, including the credentials used.
+        query
+            Function returning a coroutine that runs the query.
+
+        Returns
+        -------
+        Response
+            A new response holding the result of the query.
+        """
+        task = self._running.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_query(query))
+            self._running[key] = task
+            task.add_done_callback(partial(self._finished, key))
+
+        # Shield the shared task so a client disconnecting does not cancel
+        # the query for the other requests waiting on it.
+        result = await asyncio.shield(task)
+        return result.to_response()
+
+    def _finished(
+        self, key: Hashable, task: asyncio.Task[_QueryResult]
+    ) -> None:
+        """Forget a query once it has finished."""
+        self._running.pop(key, None)
+
+        # Retrieve any exception so asyncio does not report it as never
+        # retrieved if every waiting request was cancelled. Waiters still
+        # raise it when they await the task.
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    async def _run_query(
+        query: Callable[[], Coroutine[Any, Any, Response]],
+    ) -> _QueryResult:
+        """Run a query and capture its result."""
+        return _QueryResult.from_response(await query())
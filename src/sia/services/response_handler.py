@@ -1,12 +1,10 @@
 """Module for the Query Processor service."""
 
 from collections.abc import Callable
-from pathlib import Path
 
 import astropy
 import structlog
 from fastapi import Request
-from fastapi.templating import Jinja2Templates
 from lsst.daf.butler import Butler
 from lsst.dax.obscore import ExporterConfig
 from lsst.dax.obscore.siav2 import SIAv2Parameters
@@ -16,18 +14,19 @@ from ..constants import BASE_RESOURCE_IDENTIFIER
 from ..constants import RESULT_NAME as RESULT
 from ..factory import Factory
 from ..models.data_collections import ButlerDataCollection
+from ..services.document_cache import DocumentCache
 from ..services.votable import VotableConverterService
+from ..templating import templates
 
 logger = structlog.get_logger(__name__)
 
+_SELF_DESCRIPTION_TEMPLATE = templates.get_template("self_description.xml")
+
 SIAv2QueryType = Callable[
     [Butler, ExporterConfig, SIAv2Parameters],
     astropy.io.votable.tree.VOTableFile,
 ]
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-_TEMPLATES = Jinja2Templates(directory=str(Path(BASE_DIR, "templates")))
-
 
 class ResponseHandlerService:
     """Service for handling the SIAv2 query response."""
@@ -35,9 +34,10 @@ class ResponseHandlerService:
     @staticmethod
     def self_description_response(
         request: Request,
-        butler: Butler,
+        instruments: list[str],
         obscore_config: ExporterConfig,
         butler_collection: ButlerDataCollection,
+        cache: DocumentCache,
     ) -> Response:
         """Return a self-description response for the SIAv2 service.
         This should provide metadata about the expected parameters and return
@@ -47,37 +47,41 @@ class ResponseHandlerService:
         ----------
         request
             The request object.
-        butler
-            The Butler instance.
+        instruments
+            The names of the instruments in the Butler repository.
         obscore_config
             The ObsCore configuration.
         butler_collection
             The Butler data collection.
+        cache
+            Cache of rendered self-descriptions.
 
         Returns
         -------
         Response
             The response containing the self-description.
         """
-        return _TEMPLATES.TemplateResponse(
-            request,
-            "self_description.xml",
-            {
-                "request": request,
-                "instruments": [
-                    rec.name
-                    for rec in butler.query_dimension_records("instrument")
-                ],
-                "collections": [obscore_config.obs_collection],
+        access_url = request.url_for(
+            "query", collection_name=butler_collection.name
+        )
+        # The cache lives in the process context, where the instruments and
+        # ObsCore configuration are fixed for each label, so only the access
+        # URL taken from the request needs to be part of the key.
+        xml = cache.get(
+            (butler_collection.label, str(access_url)),
+            lambda: _SELF_DESCRIPTION_TEMPLATE.render(
+                instruments=instruments,
+                collections=[obscore_config.obs_collection],
                 # This may need to be updated if we decide to change the
                 # dax_obscore config to hold multiple collections
-                "resource_identifier": f"{BASE_RESOURCE_IDENTIFIER}/"
+                resource_identifier=f"{BASE_RESOURCE_IDENTIFIER}/"
                 f"{butler_collection.label}",
-                "access_url": request.url_for(
-                    "query", collection_name=butler_collection.name
-                ),
-                "facility_name": obscore_config.facility_name.strip(),
-            },
+                access_url=access_url,
+                facility_name=obscore_config.facility_name.strip(),
+            ).encode(),
+        )
+        return Response(
+            content=xml,
             headers={
                 "content-disposition": f"attachment; filename={RESULT}.xml",
                 "Content-Type": "application/x-votable+xml",
@@ -85,6 +89,48 @@ class ResponseHandlerService:
             media_type="application/x-votable+xml",
         )
 
+    @staticmethod
+    def _get_instruments(
+        *,
+        factory: Factory,
+        collection: ButlerDataCollection,
+        token: str | None,
+    ) -> list[str]:
+        """Return the names of the instruments in a collection's repository.
+
+        The instruments of a repository rarely change, so they are queried
+        once per collection, with the first caller's token, and the names are
+        then served to all users, including unauthenticated callers and
+        callers whose token would fail the query. If that first query fails,
+        nothing is cached and the next request queries again.
+
+        Parameters
+        ----------
+        factory
+            The Factory instance.
+        collection
+            The Butler data collection.
+        token
+            The token to use for the Butler (Optional).
+
+        Returns
+        -------
+        list of str
+            The instrument names.
+        """
+        cache = factory.create_instrument_cache()
+        instruments = cache.get(collection.label)
+        if instruments is None:
+            butler = factory.create_butler(
+                butler_collection=collection, token=token
+            )
+            instruments = [
+                rec.name
+                for rec in butler.query_dimension_records("instrument")
+            ]
+            cache[collection.label] = instruments
+        return instruments
+
     @staticmethod
     def process_query(
         *,
@@ -123,20 +169,24 @@ class ResponseHandlerService:
             method=request.method,
         )
 
-        butler = factory.create_butler(
-            butler_collection=collection,
-            token=token,
-        )
         obscore_config = factory.create_obscore_config(collection.label)
 
         if params.maxrec == 0:
             return ResponseHandlerService.self_description_response(
                 request=request,
-                butler=butler,
+                instruments=ResponseHandlerService._get_instruments(
+                    factory=factory, collection=collection, token=token
+                ),
                 obscore_config=obscore_config,
                 butler_collection=collection,
+                cache=factory.create_self_description_cache(),
             )
 
+        butler = factory.create_butler(
+            butler_collection=collection,
+            token=token,
+        )
+
         # Execute the query
         table_as_votable = sia_query(
             butler,
@@ -144,8 +194,9 @@ class ResponseHandlerService:
             params,
         )
 
-        # Convert the result to a string
-        result = VotableConverterService(table_as_votable).to_string()
+        # Serialize the result. Response sends bytes as they are, so there is
+        # no need to decode to a string and have it encoded again.
+        result = VotableConverterService(table_as_votable).to_bytes()
 
         # For the moment only VOTable is supported, so we can hardcode the
         # media_type and the file extension.
@@ -30,6 +30,16 @@ class VotableConverterService:
             The VOTableFile object as a string.
 
         """
+        return self.to_bytes().decode("utf-8")
+
+    def to_bytes(self) -> bytes:
+        """Convert the VOTableFile object to UTF-8 encoded XML.
+
+        Returns
+        -------
+        bytes
+            The VOTableFile object as encoded XML.
+        """
         with io.BytesIO() as output:
             self.votable.to_xml(output)
-            return output.getvalue().decode("utf-8")
+            return output.getvalue()
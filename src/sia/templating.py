@@ -0,0 +1,24 @@
+"""Shared Jinja templates for the XML documents served by sia."""
+
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+
+__all__ = ["templates"]
+
+templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
+"""Templates for sia, loaded from the package ``templates`` directory."""
+
+
+def _precompile() -> None:
+    """Compile every template up front.
+
+    The templates ship with the package and never change while the app is
+    running, so the per-lookup modification time check is also disabled.
+    """
+    templates.env.auto_reload = False
+    for name in templates.env.list_templates():
+        templates.get_template(name)
+
+
+_precompile()
@@ -153,7 +153,7 @@ async def test_config_remote() -> Config:
             butler_type=ButlerType.REMOTE,
         ),
     ]
-    return Config(
+    return Config.from_trusted(
         path_prefix="/api/sia",
         butler_data_collections=butler_collections,
     )
@@ -182,7 +182,7 @@ async def test_config_direct() -> Config:
         ),
     ]
 
-    return Config(
+    return Config.from_trusted(
         butler_data_collections=butler_collections,
     )
 
@@ -207,10 +207,11 @@ def mock_async_client(
     mock_response.status_code = 200
 
     mock_client = AsyncMock(spec=AsyncClient)
-    mock_client.__aenter__.return_value.get.return_value = mock_response
+    mock_client.get.return_value = mock_response
 
     monkeypatch.setattr(
-        "sia.services.availability.AsyncClient", lambda: mock_client
+        "sia.services.availability.http_client_dependency",
+        AsyncMock(return_value=mock_client),
     )
 
     return mock_client, mock_response
@@ -1,7 +1,8 @@
 """Tests for the Exceptions module."""
 
 import pytest
-from fastapi import FastAPI
+from defusedxml import ElementTree as DefusedET
+from fastapi import FastAPI, Request
 
 from sia.errors import votable_exception_handler
 from sia.exceptions import (
@@ -45,3 +46,20 @@ async def test_default_fault() -> None:
     exc = DefaultFaultError("Test default fault")
     assert str(exc) == "DefaultFault: Test default fault"
     assert exc.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_votable_error_escapes_message() -> None:
+    """Test that the error message is escaped in the VOTable."""
+    request = Request(
+        {"type": "http", "method": "GET", "path": "/", "headers": []}
+    )
+    exc = UsageFaultError("POS must satisfy 0 < radius & <b>bold</b>")
+    response = await votable_exception_handler(request, exc)
+
+    assert response.status_code == 400
+    assert response.media_type == "application/xml"
+    root = DefusedET.fromstring(response.body)
+    info = root.find(".//{http://www.ivoa.net/xml/VOTable/v1.3}INFO")
+    assert info is not None
+    assert info.text == str(exc)
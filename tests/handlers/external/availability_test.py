@@ -3,16 +3,19 @@ This test checks that the availability endpoint returns the
 expected XML response, read from the templates/availability.xml file.
 """
 
+import asyncio
+from datetime import timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import APIRouter
 from fastapi.templating import Jinja2Templates
-from httpx import AsyncClient
+from httpx import AsyncClient, ReadTimeout
 
 from sia.config import Config, config
 from sia.services.availability import (
+    AvailabilityCache,
     AvailabilityService,
     DirectButlerAvailabilityChecker,
     RemoteButlerAvailabilityChecker,
@@ -61,14 +64,18 @@ async def test_remote_butler_availability_success(
     ).get_data_collection_by_name(name="dp02")
 
     checker = RemoteButlerAvailabilityChecker()
-    with patch("sia.services.availability.AsyncClient") as mock_client:
+    with patch(
+        "sia.services.availability.http_client_dependency",
+        new_callable=AsyncMock,
+    ) as mock_client:
         mock_response = AsyncMock()
         mock_response.status_code = 200
-        mock_client.return_value.__aenter__.return_value.get.return_value = (
-            mock_response
-        )
+        mock_client.return_value.get.return_value = mock_response
         availability = await checker.check_availability(collection=collection)
     assert availability.available is True
+    mock_client.return_value.get.assert_awaited_once_with(
+        str(collection.repository), timeout=5.0
+    )
 
 
 @pytest.mark.asyncio
@@ -83,17 +90,36 @@ async def test_remote_butler_availability_failure(
     ).get_data_collection_by_name(name="dp02")
 
     checker = RemoteButlerAvailabilityChecker()
-    with patch("sia.services.availability.AsyncClient") as mock_client:
+    with patch(
+        "sia.services.availability.http_client_dependency",
+        new_callable=AsyncMock,
+    ) as mock_client:
         mock_response = AsyncMock()
         mock_response.status_code = 404
-        mock_client.return_value.__aenter__.return_value.get.return_value = (
-            mock_response
-        )
+        mock_client.return_value.get.return_value = mock_response
 
         availability = await checker.check_availability(collection=collection)
     assert availability.available is False
 
 
+@pytest.mark.asyncio
+async def test_remote_butler_availability_timeout(
+    test_config_remote: Config,
+    mock_async_client: tuple[AsyncMock, AsyncMock],
+) -> None:
+    """Test that a remote Butler check timing out reports unavailable."""
+    collection = DataCollectionService(
+        config=test_config_remote
+    ).get_data_collection_by_name(name="dp02")
+    mock_client, _ = mock_async_client
+    mock_client.get.side_effect = ReadTimeout("timed out")
+
+    checker = RemoteButlerAvailabilityChecker()
+    availability = await checker.check_availability(collection=collection)
+    assert availability.available is False
+    assert availability.note == ["Butler check failed: ReadTimeout"]
+
+
 @pytest.mark.asyncio
 async def test_availability_service(test_config_direct: Config) -> None:
     """Test the availability service."""
@@ -104,3 +130,59 @@ async def test_availability_service(test_config_direct: Config) -> None:
     service = AvailabilityService(collection=collection)
     availability = await service.get_availability()
     assert availability.available is True
+
+
+@pytest.mark.asyncio
+async def test_availability_cache(
+    test_config_remote: Config,
+    mock_async_client: tuple[AsyncMock, AsyncMock],
+) -> None:
+    """Test that the availability cache reuses recent checks."""
+    collection = DataCollectionService(
+        config=test_config_remote
+    ).get_data_collection_by_name(name="dp02")
+    mock_client, _ = mock_async_client
+
+    cache = AvailabilityCache(ttl=timedelta(minutes=5))
+    first = await cache.get_availability_xml(collection)
+    second = await cache.get_availability_xml(collection)
+    assert first == second
+    assert mock_client.get.call_count == 1
+
+    mock_client.get.reset_mock()
+    cache = AvailabilityCache(ttl=timedelta(0))
+    await cache.get_availability_xml(collection)
+    await cache.get_availability_xml(collection)
+    assert mock_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_availability_cache_concurrent(
+    test_config_remote: Config,
+    mock_async_client: tuple[AsyncMock, AsyncMock],
+) -> None:
+    """Test that concurrent cache misses share a single check."""
+    collection = DataCollectionService(
+        config=test_config_remote
+    ).get_data_collection_by_name(name="dp02")
+    mock_client, mock_response = mock_async_client
+
+    async def slow_get(*args: object, **kwargs: object) -> AsyncMock:
+        await asyncio.sleep(0.01)
+        return mock_response
+
+    mock_client.get.side_effect = slow_get
+
+    cache = AvailabilityCache(ttl=timedelta(minutes=5))
+    results = await asyncio.gather(
+        *(cache.get_availability_xml(collection) for _ in range(5))
+    )
+    assert len(set(results)) == 1
+    assert mock_client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_availability_unknown_collection(client: AsyncClient) -> None:
+    """Test the availability endpoint with an unknown collection."""
+    r = await client.get(f"{config.path_prefix}/unknown/availability")
+    assert r.status_code == 404
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
+import threading
+from collections.abc import Hashable
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from fastapi.templating import Jinja2Templates
 from httpx import AsyncClient
+from lsst.daf.butler import LabeledButlerFactory
+from starlette.responses import Response
 
 from sia.config import config
 from sia.constants import RESULT_NAME
+from sia.dependencies.context import context_dependency
 from tests.support.butler import MockButler, MockButlerQueryService
 from tests.support.constants import EXCEPTION_MESSAGES
 from tests.support.validators import validate_votable_error
@@ -107,6 +114,64 @@ async def test_query_endpoint_mocker_get(
     )
 
 
+@pytest.mark.asyncio
+async def test_query_coalescing_gzip(
+    client: AsyncClient,
+    mock_butler: MockButler,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test coalesced queries for clients accepting different encodings."""
+    monkeypatch.setattr(config, "query_coalescing", True)
+    await context_dependency.initialize(config=config)
+    coalescer = context_dependency.process_context.query_coalescer
+    assert coalescer
+    votable = MockButlerQueryService.siav2_query()
+    release = threading.Event()
+
+    def blocking_query(*args: Any) -> Any:
+        # Keep the query running until the second request has joined it.
+        assert release.wait(timeout=10)
+        return votable
+
+    # The coalescer looks up the running query before its first await, so
+    # once the second request has called it, that request has joined.
+    run = coalescer.run
+    joined = asyncio.Event()
+
+    async def counting_run(key: Hashable, query: Any) -> Response:
+        if mock_run.call_count == 2:
+            joined.set()
+        return await run(key, query)
+
+    url = f"{config.path_prefix}/dp02/query?POS=CIRCLE+320+-0.1+10.7"
+    with (
+        patch(
+            "sia.handlers.external.siav2_query", side_effect=blocking_query
+        ) as mock,
+        patch.object(coalescer, "run", side_effect=counting_run) as mock_run,
+    ):
+        requests = asyncio.gather(
+            client.get(url, headers={"Accept-Encoding": "gzip"}),
+            client.get(url, headers={"Accept-Encoding": "identity"}),
+        )
+        await joined.wait()
+        release.set()
+        compressed, identity = await requests
+    assert mock.call_count == 1
+
+    assert compressed.status_code == 200
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert int(compressed.headers["Content-Length"]) == (
+        compressed.num_bytes_downloaded
+    )
+
+    assert identity.status_code == 200
+    assert "Content-Encoding" not in identity.headers
+    assert int(identity.headers["Content-Length"]) == len(identity.content)
+    assert identity.content == compressed.content
+    assert identity.headers["content-type"] == "application/x-votable+xml"
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -254,3 +319,54 @@ async def test_query_maxrec_zero(
 
     assert response.status_code == 200
     assert response.text.strip() == template_rendered.strip()
+
+
+@pytest.mark.asyncio
+async def test_query_maxrec_zero_reuses_instruments(
+    client_direct: AsyncClient,
+) -> None:
+    """Test that only the first self-description request uses a Butler."""
+    url = f"{config.path_prefix}/hsc/query?MAXREC=0"
+    first = await client_direct.get(url)
+    assert first.status_code == 200
+
+    with patch.object(LabeledButlerFactory, "create_butler") as mock:
+        second = await client_direct.get(url)
+    assert mock.call_count == 0
+    assert second.status_code == 200
+    assert second.text == first.text
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query_coalescing", [False, True], ids=["uncoalesced", "coalesced"]
+)
+async def test_query_maxrec_zero_gzip(
+    client_direct: AsyncClient,
+    query_coalescing: bool,  # noqa: FBT001 (pytest passes it positionally)
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that gzip encoding applies to each response on its own.
+
+    With coalescing on, the concurrent requests share one query result, so
+    this also checks that compressing one response leaves the other intact.
+    """
+    monkeypatch.setattr(config, "query_coalescing", query_coalescing)
+    await context_dependency.initialize(config=config)
+    url = f"{config.path_prefix}/hsc/query?MAXREC=0"
+
+    compressed, identity = await asyncio.gather(
+        client_direct.get(url, headers={"Accept-Encoding": "gzip"}),
+        client_direct.get(url, headers={"Accept-Encoding": "identity"}),
+    )
+    assert compressed.status_code == 200
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert int(compressed.headers["Content-Length"]) == (
+        compressed.num_bytes_downloaded
+    )
+    assert compressed.text.lstrip().startswith("<?xml")
+
+    assert identity.status_code == 200
+    assert "Content-Encoding" not in identity.headers
+    assert int(identity.headers["Content-Length"]) == len(identity.content)
+    assert identity.content == compressed.content
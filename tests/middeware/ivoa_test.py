@@ -3,6 +3,8 @@
 import pytest
 from httpx import AsyncClient
 
+from sia.middleware.ivoa import CaseInsensitiveFormMiddleware
+
 
 @pytest.mark.asyncio
 async def test_lowercase_form_keys(client: AsyncClient) -> None:
@@ -51,3 +53,25 @@ async def test_content_type(client: AsyncClient) -> None:
         "method": "POST",
         "form_data": {"uppercase": "value"},
     }
+
+
+@pytest.mark.asyncio
+async def test_process_form_data_preserves_values() -> None:
+    """Test that only keys are rewritten and empty fields are dropped."""
+    body = b"POS=CIRCLE+321%2B0+1&Empty=&Flag&MAXREC=5"
+    processed = await CaseInsensitiveFormMiddleware.process_form_data(body)
+    assert processed == b"pos=CIRCLE+321%2B0+1&maxrec=5"
+
+    # Percent-encoded key characters are lowercased too.
+    body = b"M%41XREC=0&CAL%49B=1&POS=CIRCLE+0+%2B1+2"
+    processed = await CaseInsensitiveFormMiddleware.process_form_data(body)
+    assert processed == b"maxrec=0&calib=1&pos=CIRCLE+0+%2B1+2"
+
+
+@pytest.mark.asyncio
+async def test_form_body_too_large(client: AsyncClient) -> None:
+    """Test that oversized form bodies are rejected."""
+    response = await client.post(
+        "/test-params", data={"key": "x" * (1024 * 1024)}
+    )
+    assert response.status_code == 413
@@ -44,3 +44,14 @@ async def test_config_no_butler_type(
         "Please configure at least one Data collection.",
     ):
         Config()
+
+
+@pytest.mark.asyncio
+async def test_config_from_trusted_no_collections() -> None:
+    """Test that a trusted Config still requires a data collection."""
+    with pytest.raises(
+        FatalFaultError,
+        match="FatalFault: No Data Collections configured. "
+        "Please configure at least one Data collection.",
+    ):
+        Config.from_trusted(butler_data_collections=[])
@@ -0,0 +1,44 @@
+"""Tests for the data collection models."""
+
+from pathlib import Path
+
+import pytest
+from pydantic import HttpUrl
+
+from sia.models.butler_type import ButlerType
+from sia.models.data_collections import ButlerDataCollection
+
+CONFIG_PATH = Path(__file__).parent.parent / "data" / "config" / "dp02.yaml"
+
+
+def _collection(datalink_url: HttpUrl | None) -> ButlerDataCollection:
+    return ButlerDataCollection(
+        config=CONFIG_PATH,
+        repository=HttpUrl("https://example.com/repo/dp02/butler.yaml"),
+        label="LSST.DP02",
+        name="dp02",
+        butler_type=ButlerType.REMOTE,
+        datalink_url=datalink_url,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_exporter_config_datalink_override() -> None:
+    """Test that a configured datalink URL replaces the one in the config."""
+    datalink_url = HttpUrl("https://example.com/api/datalink/links?ID={id}")
+    exporter_config = _collection(datalink_url).get_exporter_config()
+    assert exporter_config.dataset_types
+    for dataset_type in exporter_config.dataset_types.values():
+        assert dataset_type.datalink_url_fmt == str(datalink_url)
+
+
+@pytest.mark.asyncio
+async def test_get_exporter_config_no_datalink() -> None:
+    """Test that the config's datalink URL is kept if none is configured."""
+    exporter_config = _collection(None).get_exporter_config()
+    assert exporter_config.dataset_types
+    for dataset_type in exporter_config.dataset_types.values():
+        assert dataset_type.datalink_url_fmt is not None
+        assert dataset_type.datalink_url_fmt.startswith(
+            "https://data.lsst.cloud/api/datalink/links"
+        )
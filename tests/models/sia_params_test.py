@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import fields
+
 import pytest
 
 from sia.models.common import CaseInsensitiveEnum
@@ -158,3 +160,35 @@ def sample_sia_params() -> SIAQueryParams:
         maxrec=10,
         responseformat="application/x-votable+xml",
     )
+
+
+@pytest.mark.asyncio
+async def test_sia_params_to_dict() -> None:
+    """Test that to_dict only includes the parameters that were set."""
+    params = SIAQueryParams(
+        pos=["CIRCLE 0 0 1"], calib=[CalibLevel.LEVEL2], maxrec=5
+    )
+    assert params.to_dict() == {
+        "pos": ["CIRCLE 0 0 1"],
+        "calib": [CalibLevel.LEVEL2],
+        "maxrec": 5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_sia_params_from_dict() -> None:
+    """Test building SIAQueryParams from a dictionary of form values."""
+    params = SIAQueryParams.from_dict(
+        {"pos": ["CIRCLE 0 0 1"], "maxrec": "5", "unknown": ["x"]}
+    )
+    assert params.pos == ["CIRCLE 0 0 1"]
+    assert params.to_butler_parameters().maxrec == 5
+    assert params.time is None
+
+
+@pytest.mark.asyncio
+async def test_sia_params_fields_are_positional() -> None:
+    """Test that from_dict can pass every field positionally."""
+    assert all(
+        field.init and not field.kw_only for field in fields(SIAQueryParams)
+    )
@@ -19,9 +19,9 @@ async def test_get_data_repositories(test_config_remote: Config) -> None:
         "LSST.DP02": "https://example.com/api/butler/repo/dp02/butler.yaml"
     }
 
-    result = DataCollectionService(
-        config=test_config_remote
-    ).get_data_repositories()
+    result = DataCollectionService.get_data_repositories(
+        test_config_remote.butler_data_collections
+    )
 
     assert (
         result == expected_repos
@@ -105,3 +105,14 @@ async def test_get_data_collection_invalid_label(
         DataCollectionService(
             config=test_config_remote
         ).get_data_collection_by_label(label="InvalidLabel")
+
+
+@pytest.mark.asyncio
+async def test_get_data_collection_name_case_insensitive(
+    test_config_remote: Config,
+) -> None:
+    """Test that data collection names are matched case-insensitively."""
+    service = DataCollectionService(config=test_config_remote)
+    result = service.get_data_collection_by_name(name="DP02")
+    assert result is service.get_data_collection_by_name(name="dp02")
+    assert result.label == "LSST.DP02"
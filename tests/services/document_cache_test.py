@@ -0,0 +1,30 @@
+"""Tests for the rendered document cache."""
+
+import pytest
+
+from sia.services.document_cache import DocumentCache
+
+
+@pytest.mark.asyncio
+async def test_document_cache() -> None:
+    """Test that documents are rendered once and the cache is bounded."""
+    renders: list[str] = []
+
+    def render(name: str) -> bytes:
+        renders.append(name)
+        return name.encode()
+
+    cache = DocumentCache(max_size=2)
+    assert cache.get("a", lambda: render("a")) == b"a"
+    assert cache.get("a", lambda: render("a")) == b"a"
+    assert renders == ["a"]
+
+    # Filling the cache evicts the least recently used document.
+    cache.get("b", lambda: render("b"))
+    cache.get("a", lambda: render("a"))
+    cache.get("c", lambda: render("c"))
+    assert renders == ["a", "b", "c"]
+    cache.get("a", lambda: render("a"))
+    assert renders == ["a", "b", "c"]
+    cache.get("b", lambda: render("b"))
+    assert renders == ["a", "b", "c", "b"]
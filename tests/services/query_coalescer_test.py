@@ -0,0 +1,59 @@
+"""Tests for the query coalescer."""
+
+import asyncio
+
+import pytest
+from starlette.responses import Response
+
+from sia.services.query_coalescer import QueryCoalescer
+
+
+@pytest.mark.asyncio
+async def test_query_coalescer_shares_running_query() -> None:
+    """Test that identical concurrent queries run once."""
+    calls = 0
+
+    async def query() -> Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return Response(content=f"result {calls}")
+
+    coalescer = QueryCoalescer()
+    responses = await asyncio.gather(
+        *(coalescer.run("key", query) for _ in range(5))
+    )
+    assert calls == 1
+    assert all(r.body == b"result 1" for r in responses)
+
+    # Each request gets its own response object, so middleware modifying
+    # one response does not affect the others.
+    assert len({id(r) for r in responses}) == len(responses)
+    assert len({id(r.raw_headers) for r in responses}) == len(responses)
+
+    # Different keys, and queries after the first finished, run again.
+    await asyncio.gather(
+        coalescer.run("key", query), coalescer.run("other", query)
+    )
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_query_coalescer_shares_failure() -> None:
+    """Test that a failing shared query raises in every waiting request."""
+    calls = 0
+
+    async def query() -> Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("query failed")
+
+    coalescer = QueryCoalescer()
+    results = await asyncio.gather(
+        *(coalescer.run("key", query) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert calls == 1
+    assert all(isinstance(r, ValueError) for r in results)
+    assert coalescer._running == {}